@@ -26,6 +26,12 @@ import traceback
 from graphql_module import GraphQLModule, GraphQLLibrary
 
 
+# Repeated lines of the end_analysis summary
+_SUMMARY_BAR = '[GraphQL] │'
+_SUMMARY_BOX_END = '[GraphQL] └' + '─' * 63
+_SUMMARY_RULE = '[GraphQL] ' + '═' * 64
+
+
 class GraphQLAnalyzerExtension(ua.Extension):
     """
     GraphQL Analyzer Extension.
@@ -44,6 +50,8 @@ class GraphQLAnalyzerExtension(ua.Extension):
         """Initialize the analyzer with default configuration."""
         self.active = True
         self.extensions = ['.graphql', '.gql', '.graphqls']
+        # Normalized suffixes ('.ext', lower case) for the per-file check
+        self._suffixes = self._normalize_extensions(self.extensions)
         # Main container for all parsed modules
         self.library = GraphQLLibrary()
     
@@ -68,7 +76,23 @@ class GraphQLAnalyzerExtension(ua.Extension):
         except Exception as e:
             # Fallback for unit tests where get_ua_options() may not be available
             log.debug('[GraphQL] Using default configuration: ' + str(e))
-            pass
+        
+        # Normalize once here rather than on every start_file() call
+        self._suffixes = self._normalize_extensions(self.extensions)
+    
+    @staticmethod
+    def _normalize_extensions(extensions):
+        """
+        Build the accepted file name suffixes, with leading dot and lower case.
+        
+        Args:
+            extensions (list): Extensions as configured (e.g. ['.graphql', 'gql'])
+            
+        Returns:
+            tuple: Normalized suffixes (e.g. ('.graphql', '.gql')), usable
+            directly with str.endswith()
+        """
+        return tuple('.' + e.lstrip('.').lower() for e in extensions)
     
     def start_file(self, file):
         """
@@ -87,15 +111,11 @@ class GraphQLAnalyzerExtension(ua.Extension):
             return
         
         filepath = file.get_path()
-        filename = os.path.basename(filepath).lower()
-        _, ext = os.path.splitext(filepath)
         
-        # Normalize extension (remove leading dot if present)
-        ext = ext.lstrip('.').lower()
-        
-        # Check if this file matches our language extensions
-        extensions_normalized = [e.lstrip('.').lower() for e in self.extensions]
-        if ext not in extensions_normalized:
+        # Check if this file matches our language extensions; as with
+        # os.path.splitext(), a name such as '.graphql' has no extension
+        if (not filepath.lower().endswith(self._suffixes) or
+                '.' not in os.path.basename(filepath).lstrip('.')):
             log.debug('[GraphQL] Skipping non-GraphQL file: ' + filepath)
             return
         
@@ -111,7 +131,7 @@ class GraphQLAnalyzerExtension(ua.Extension):
             # Store module in library for Phase 2 processing
             self.library.add_module(module)
             
-            log.debug('[GraphQL] Light parse complete for: ' + filename)
+            log.debug('[GraphQL] Light parse complete for: ' + module.get_filename())
             
         except Exception as e:
             log.warning('[GraphQL] Error during light parse of ' + filepath + ': ' + str(e))
@@ -121,11 +141,13 @@ class GraphQLAnalyzerExtension(ua.Extension):
         """
         PHASE 2: Full parsing and reference resolution.
         
-        Called once after all files have been processed. For each module:
-        1. Run full_parse() to detect calls (REQUIRES MANUAL IMPLEMENTATION)
-        2. Resolve references using the complete symbol table (REQUIRES MANUAL IMPLEMENTATION)
-        3. Create links between objects (REQUIRES MANUAL IMPLEMENTATION)
-        4. Clean up AST to free memory
+        Called once after all files have been processed. The library then
+        handles each module (see GraphQLLibrary.process_all()):
+        1. Run process(), which calls in sequence:
+           - full_parse(): detect calls
+           - resolve(): resolve references using the complete symbol table
+           - save_links(): create links between objects
+        2. Clean up AST to free memory
         
         NOTE: Link detection, resolution, and creation are SKELETON methods.
         You must implement technology-specific logic in the module class.
@@ -134,101 +156,77 @@ class GraphQLAnalyzerExtension(ua.Extension):
         if not self.active:
             return
         
+        # Modules of the analysis, shared by the processing and the summary
+        modules = self.library.get_modules()
+        
         log.debug('[GraphQL] Starting Phase 2: Full parsing')
-        log.debug('[GraphQL] Total modules to process: ' + str(len(self.library.get_modules())))
-        
-        # Statistics for logging
-        total_objects = 0
-        total_links = 0
-        errors = 0
-        
-        for module in self.library.get_modules():
-            try:
-                log.debug('[GraphQL] Full parsing: ' + str(module.get_path()))
-                
-                # PHASE 2: Full parse for detailed structure (MANUAL IMPLEMENTATION REQUIRED)
-                # By default, this is a skeleton that does nothing.
-                # Implement technology-specific call detection in the module class.
-                module.full_parse()
-                
-                # Resolve references using complete symbol table (MANUAL IMPLEMENTATION REQUIRED)
-                # By default, this is a skeleton that does nothing.
-                # Implement technology-specific resolution in the module class.
-                module.resolve(self.library)
-                
-                # Count objects created in Pass 1
-                total_objects += len(module.objects)
-                
-                # Create links between objects (MANUAL IMPLEMENTATION REQUIRED)
-                # By default, this returns 0 because it's a skeleton.
-                # Implement technology-specific link creation in the module class.
-                links_count = module.save_links()
-                total_links += links_count
-                
-                # Clean up AST to free memory
-                module.clean_ast()
-                
-            except Exception as e:
-                errors += 1
-                log.warning('[GraphQL] Error during full parse of ' + 
-                           str(module.get_path()) + ': ' + str(e))
-                log.debug('[GraphQL] ' + traceback.format_exc())
+        log.debug('[GraphQL] Total modules to process: ' + str(len(modules)))
+        
+        # Process all modules; per-module errors are logged and counted
+        total_objects, total_links, errors = self.library.process_all()
         
         # =====================================================================
         # FINAL SUMMARY
         # =====================================================================
-        log.info('[GraphQL] ')
-        log.info('[GraphQL] ╔══════════════════════════════════════════════════════════════╗')
-        log.info('[GraphQL] ║              GraphQL ANALYSIS SUMMARY                          ║')
-        log.info('[GraphQL] ╚══════════════════════════════════════════════════════════════╝')
+        # The summary is built as a list of lines and logged in a single call
+        lines = []
+        append = lines.append
+        
+        append('[GraphQL] ')
+        append('[GraphQL] ╔══════════════════════════════════════════════════════════════╗')
+        append('[GraphQL] ║              GraphQL ANALYSIS SUMMARY                          ║')
+        append('[GraphQL] ╚══════════════════════════════════════════════════════════════╝')
         
         # --- OBJECTS BY FILE ---
-        log.info('[GraphQL] ')
-        log.info('[GraphQL] ┌─── OBJECTS CREATED (' + str(total_objects) + ' total) ───')
-        for module in self.library.get_modules():
-            filename = os.path.basename(module.get_path())
+        append('[GraphQL] ')
+        append('[GraphQL] ┌─── OBJECTS CREATED (' + str(total_objects) + ' total) ───')
+        # Display name of each object type, e.g. 'GraphQLType' -> 'Type':
+        # computed once per type rather than once per object
+        short_types = {}
+        for module in modules:
+            filename = module.get_filename()
             objects_in_file = []
-            for fullname in module.objects.keys():
+            for fullname, obj_type in module.object_types.items():
                 if fullname != module.get_path():  # Skip Program objects
                     # Extract short name from fullname
-                    short = fullname.split('.')[-1] if '.' in fullname else fullname
-                    # Get type
-                    for obj_type, objs in module.objects_by_type.items():
-                        if module.objects[fullname] in objs:
-                            objects_in_file.append((short, obj_type))
-                            break
+                    short = fullname.rpartition('.')[2]
+                    objects_in_file.append((short, obj_type))
             if objects_in_file:
-                log.info('[GraphQL] │')
-                log.info('[GraphQL] │  ' + filename)
+                append(_SUMMARY_BAR)
+                append('[GraphQL] │  ' + filename)
                 for obj_name, obj_type in objects_in_file:
-                    type_short = obj_type.replace('GraphQL', '')
-                    log.info('[GraphQL] │    └─ ' + obj_name + ' (' + type_short + ')')
+                    type_short = short_types.get(obj_type)
+                    if type_short is None:
+                        type_short = short_types[obj_type] = obj_type.replace('GraphQL', '')
+                    append('[GraphQL] │    └─ ' + obj_name + ' (' + type_short + ')')
         
-        log.info('[GraphQL] │')
-        log.info('[GraphQL] └───────────────────────────────────────────────────────────────')
+        append(_SUMMARY_BAR)
+        append(_SUMMARY_BOX_END)
         
         # --- LINKS STATUS ---
-        log.info('[GraphQL] ')
+        append('[GraphQL] ')
         if total_links == 0:
-            log.info('[GraphQL] ┌─── LINKS ───')
-            log.info('[GraphQL] │')
-            log.info('[GraphQL] │  No links created (expected for skeleton implementation)')
-            log.info('[GraphQL] │')
-            log.info('[GraphQL] │  To create links, implement these methods in the module class:')
-            log.info('[GraphQL] │    - full_parse(): Detect function/method calls')
-            log.info('[GraphQL] │    - resolve(): Resolve call targets using the symbol table')
-            log.info('[GraphQL] │    - save_links(): Create links using create_link() SDK method')
-            log.info('[GraphQL] │')
-            log.info('[GraphQL] │  See the module source code for detailed documentation.')
-            log.info('[GraphQL] └───────────────────────────────────────────────────────────────')
+            append('[GraphQL] ┌─── LINKS ───')
+            append(_SUMMARY_BAR)
+            append('[GraphQL] │  No links created (expected for skeleton implementation)')
+            append(_SUMMARY_BAR)
+            append('[GraphQL] │  To create links, implement these methods in the module class:')
+            append('[GraphQL] │    - full_parse(): Detect function/method calls')
+            append('[GraphQL] │    - resolve(): Resolve call targets using the symbol table')
+            append('[GraphQL] │    - save_links(): Create links using create_link() SDK method')
+            append(_SUMMARY_BAR)
+            append('[GraphQL] │  See the module source code for detailed documentation.')
+            append(_SUMMARY_BOX_END)
         else:
-            log.info('[GraphQL] ┌─── LINKS CREATED (' + str(total_links) + ' total) ───')
-            log.info('[GraphQL] │')
-            log.info('[GraphQL] │  Custom link implementation active.')
-            log.info('[GraphQL] └───────────────────────────────────────────────────────────────')
+            append('[GraphQL] ┌─── LINKS CREATED (' + str(total_links) + ' total) ───')
+            append(_SUMMARY_BAR)
+            append('[GraphQL] │  Custom link implementation active.')
+            append(_SUMMARY_BOX_END)
+        
+        append('[GraphQL] ')
+        append(_SUMMARY_RULE)
         
-        log.info('[GraphQL] ')
-        log.info('[GraphQL] ════════════════════════════════════════════════════════════════')
+        log.info('\n'.join(lines))
         
         if errors > 0:
             log.warning('[GraphQL]   Modules with errors: ' + str(errors))
@@ -31,8 +31,37 @@ Python 3.4+ compatible.
 import cast_upgrade_1_6_23  # noqa: F401 - Required for CAST SDK compatibility
 from cast.application import ApplicationLevelExtension, ReferenceFinder, create_link
 from cast.application import open_source_file
-from logging import info, debug, warning
-import traceback
+from logging import info, debug, warning, DEBUG, getLogger
+import re
+
+
+# Java annotations property, bulk loaded with the objects that need it
+ANNOTATION_PROPERTY = "CAST_Java_AnnotationMetrics.Annotation"
+
+# Fields selected by a GraphQL client definition (comma-separated)
+FIELDS_SELECTED_PROPERTY = 'GraphQL_Client_Definition.fieldsSelected'
+
+# Resolver annotation of each operation type, in matching order
+RESOLVER_MAPPINGS = (
+    ('Query', '@QueryMapping'),
+    ('Mutation', '@MutationMapping'),
+    ('Subscription', '@SubscriptionMapping'),
+)
+
+# Annotations checked on Java classes and methods, found in one pass
+ANNOTATION_RE = re.compile(r'@(?:Controller|QueryMapping|MutationMapping|SubscriptionMapping)')
+
+# Client definition type of each operation type, in linking order
+CLIENT_OPERATION_TYPES = (
+    ('GraphQLClientQuery', 'Query'),
+    ('GraphQLClientMutation', 'Mutation'),
+    ('GraphQLClientSubscription', 'Subscription'),
+)
+
+
+def _debug_enabled():
+    """Whether DEBUG messages are emitted by the root logger used by info()/debug()."""
+    return getLogger().isEnabledFor(DEBUG)
 
 
 class GraphQLApplicationLevel(ApplicationLevelExtension):
@@ -76,22 +105,123 @@ class GraphQLApplicationLevel(ApplicationLevelExtension):
         Args:
             application: CAST Application object containing all analyzed objects
         """
+        info('[GraphQL Application] Starting cross-technology link creation')
+        
         try:
-            info('[GraphQL Application] Starting cross-technology link creation')
-            
-            # Create links between client operations and schema objects
-            self._link_client_to_schema(application)
+            # Index the schema fields once for both linkers
+            schema_index = self._build_schema_index(application)
+        except Exception as e:
+            warning('[GraphQL Application] Error building the schema index, no link created: %s', e)
+            debug('[GraphQL Application] Error details', exc_info=True)
+            return
+        
+        # Links found by both linkers: [(link_type, caller, callee)]
+        pending_links = []
+        failed = False
+        
+        # Find links between client operations and schema objects, then from
+        # schema to backend methods; a failing linker does not skip the other
+        for linker in (self._link_client_to_schema, self._link_schema_to_backend):
+            try:
+                linker(application, schema_index, pending_links)
+            except Exception as e:
+                failed = True
+                warning('[GraphQL Application] Error in %s: %s', linker.__name__, e)
+                debug('[GraphQL Application] Error details', exc_info=True)
+        
+        # Create all the links in a single pass, including the links found
+        # by a linker that failed
+        self._create_links(pending_links)
+        
+        if failed:
+            warning('[GraphQL Application] Cross-technology link creation finished with errors')
+        else:
+            info('[GraphQL Application] Cross-technology link creation complete')
+    
+    def _create_links(self, pending_links):
+        """
+        Create the links found by the linkers.
+        
+        A failing link is reported and does not prevent the creation of
+        the other links.
+        
+        Args:
+            pending_links: Links to create: [(link_type, caller, callee)]
+        """
+        errors = 0
+        for link_type, caller, callee in pending_links:
+            try:
+                create_link(link_type, caller, callee)
+            except Exception as e:
+                errors += 1
+                warning('[GraphQL Application] !!! ERROR creating %s from %s to %s: %s',
+                        link_type, caller.get_fullname(), callee.get_fullname(), e)
+                debug('[GraphQL Application] Error details', exc_info=True)
+        
+        info('[GraphQL Application] Created %s links (%s errors)', len(pending_links) - errors, errors)
+    
+    def _get_java_classes(self, application):
+        """
+        Index the Java classes of the application by name.
+        
+        The classes are loaded once with their annotations, so that looking up
+        the parent class of each Java method does not rescan the application.
+        
+        Args:
+            application: CAST Application object
             
-            # Create links from schema to backend methods
-            self._link_schema_to_backend(application)
+        Returns:
+            dict: {class_name: JV_CLASS object}, first class found for each name
+        """
+        java_classes = {}
+        for o in application.objects().has_type('JV_CLASS').load_property(ANNOTATION_PROPERTY):
+            if getattr(getattr(o, "type", None), "name", None) == "JV_CLASS":
+                name = getattr(o, "name", None)
+                if name not in java_classes:
+                    java_classes[name] = o
+        return java_classes
+    
+    def _get_controller_classes(self, java_classes):
+        """
+        Keep the Java classes having the @Controller annotation.
+        
+        Args:
+            java_classes: Java classes by name (see _get_java_classes)
             
-            info('[GraphQL Application] Cross-technology link creation complete')
+        Returns:
+            dict: {class_name: JV_CLASS object} of the @Controller classes
+        """
+        controller_classes = {}
+        for name, class_obj in java_classes.items():
+            annotations = []
+            try:
+                annotations = class_obj.get_property(ANNOTATION_PROPERTY)
+            except Exception:
+                pass  # No annotations or property not loaded
+            if '@Controller' in self._get_annotation_names(annotations):
+                controller_classes[name] = class_obj
+        return controller_classes
+    
+    @staticmethod
+    def _get_annotation_names(annotations):
+        """
+        Find the annotations of interest of an object in a single regex pass.
+        
+        The annotations are joined into one text, converted to strings once.
+        A marker such as '@Controller' is found exactly when it is contained
+        in one of the annotations (e.g. '@ControllerAdvice' also yields it).
+        
+        Args:
+            annotations: Value of the annotations property (list or None)
             
-        except Exception as e:
-            warning('[GraphQL Application] Error in end_application: ' + str(e))
-            debug('[GraphQL Application] ' + traceback.format_exc())
+        Returns:
+            frozenset: Markers found, e.g. frozenset(['@Controller'])
+        """
+        if not annotations:
+            return frozenset()
+        return frozenset(ANNOTATION_RE.findall('\n'.join(str(ann) for ann in annotations)))
     
-    def _get_parent(self, obj, application):
+    def _get_parent(self, obj, java_classes):
         """
         Get the parent object by extracting the parent name from the fullname.
         
@@ -100,30 +230,80 @@ class GraphQLApplicationLevel(ApplicationLevelExtension):
         
         Args:
             obj: The object whose parent we want to retrieve
-            application: The application containing the object
+            java_classes: Java classes by name (see _get_java_classes)
             
         Returns:
             The parent object (Java class) or None if no parent is found
             
         Example:
             fullname: "com.example.demo.CorsConfig.corsFilter"
-            → extracts "CorsConfig" and searches for corresponding JV_CLASS
+            → extracts "CorsConfig" and looks up the corresponding JV_CLASS
+        """
+        # Extract the parent name from the fullname, splitting only the last
+        # two names: "com.example.demo.CorsConfig.corsFilter" -> "CorsConfig"
+        parts = obj.get_fullname().rsplit('.', 2)
+        if len(parts) < 2:
+            return None
+        return java_classes.get(parts[-2])
+    
+    def _build_schema_index(self, application):
         """
-        fullname = obj.get_fullname()
+        Build the index of schema fields used by both linkers.
+        
+        Loads the children of the Query, Mutation and Subscription
+        GraphQLType objects and indexes their GraphQLField children by name.
+        Several fields can share a name (e.g. declared again in a type
+        extension): all of them are kept, in the order they were found.
         
-        # Extract the parent name from the fullname
-        # For example: "com.example.demo.CorsConfig.corsFilter" -> "CorsConfig"
-        if '.' in fullname:
-            parent_name = fullname.split('.')[-2]
+        Args:
+            application: CAST Application object
             
-            # Search for the parent object by name
-            parent_obj = next((o for o in application.objects().load_property("CAST_Java_AnnotationMetrics.Annotation") if getattr(o, "name", None) == parent_name and getattr(getattr(o, "type", None), "name", None) == "JV_CLASS"), None)
-            return parent_obj if parent_obj else (
-                None
-            )
-        return None
+        Returns:
+            dict: {'Query': {field_name: [GraphQLField_object, ...]},
+                   'Mutation': {...}, 'Subscription': {...}}
+        """
+        info('[GraphQL Application] Building schema field index...')
+        schema_index = {'Query': {}, 'Mutation': {}, 'Subscription': {}}
+        
+        # Find Query, Mutation and Subscription types, then load their field children
+        log_debug = _debug_enabled()
+        type_count = 0
+        for type_obj in application.objects().has_type('GraphQLType'):
+            # has_type() also yields the types inheriting from GraphQLType
+            if type_obj.get_type() != 'GraphQLType':
+                continue
+            type_count += 1
+            type_name = type_obj.get_name()
+            debug('[GraphQL Application]   - Processing GraphQLType: "%s"', type_name)
+            
+            schema_fields = schema_index.get(type_name)
+            if schema_fields is None:
+                continue
+            
+            info('[GraphQL Application] Found %s type: %s', type_name, type_obj.get_fullname())
+            type_obj.load_children()
+            children = type_obj.get_children()
+            debug('[GraphQL Application]   - %s type has %s children', type_name, len(children))
+            
+            operation_name = type_name.lower()
+            for field_obj in children:
+                field_type = field_obj.get_type()
+                if field_type == 'GraphQLField':
+                    field_name = field_obj.get_name()
+                    schema_fields.setdefault(field_name, []).append(field_obj)
+                    if log_debug:
+                        debug('[GraphQL Application]   - Indexed %s field: "%s" (fullname: %s)', operation_name, field_name, field_obj.get_fullname())
+                else:
+                    debug('[GraphQL Application]   - Skipping non-field child: %s', field_type)
+        
+        debug('[GraphQL Application] Found %s GraphQLType objects', type_count)
+        info('[GraphQL Application] Schema index complete: %s query fields, %s mutation fields, '
+             '%s subscription fields', len(schema_index['Query']), len(schema_index['Mutation']),
+             len(schema_index['Subscription']))
+        
+        return schema_index
     
-    def _link_client_to_schema(self, application):
+    def _link_client_to_schema(self, application, schema_index, pending_links):
         """
         Create USE links between GraphQL client definitions and schema fields.
         
@@ -131,7 +311,7 @@ class GraphQLApplicationLevel(ApplicationLevelExtension):
         
         Linking logic:
         - Retrieves all client objects (Query, Mutation, Subscription)
-        - Builds an index of schema fields (Query, Mutation, Subscription types)
+        - Uses the index of schema fields (Query, Mutation, Subscription types)
         - For each client object, extracts the 'fieldsSelected' property
         - Creates a USE link between client and each corresponding schema field
         
@@ -141,82 +321,73 @@ class GraphQLApplicationLevel(ApplicationLevelExtension):
         
         Args:
             application: CAST Application object
+            schema_index: Schema fields by operation type (see _build_schema_index)
+            pending_links: List receiving the links to create (see _create_links)
         """
         info('[GraphQL Application] ========================================')
         info('[GraphQL Application] Starting client-to-schema linking')
         info('[GraphQL Application] ========================================')
         
-        # Use search_objects(load_properties=True) to load properties needed for linking
-        client_queries = [obj for obj in application.search_objects(load_properties=True) if obj.get_type() == 'GraphQLClientQuery']
-        client_mutations = [obj for obj in application.search_objects(load_properties=True) if obj.get_type() == 'GraphQLClientMutation']
-        client_subscriptions = [obj for obj in application.search_objects(load_properties=True) if obj.get_type() == 'GraphQLClientSubscription']
-        
-        info('[GraphQL Application] Found ' + str(len(client_queries)) + ' GraphQLClientQuery objects')
-        info('[GraphQL Application] Found ' + str(len(client_mutations)) + ' GraphQLClientMutation objects')
-        info('[GraphQL Application] Found ' + str(len(client_subscriptions)) + ' GraphQLClientSubscription objects')
-        
-        total_clients = len(client_queries) + len(client_mutations) + len(client_subscriptions)
-        if total_clients == 0:
-            warning('[GraphQL Application] No client definitions found')
-            return
-        
-        info('[GraphQL Application] Building schema field index...')
-        schema_queries = {}
-        schema_mutations = {}
-        schema_subscriptions = {}
+        schema_queries = schema_index['Query']
+        schema_mutations = schema_index['Mutation']
+        schema_subscriptions = schema_index['Subscription']
         
-        graphql_types = [obj for obj in application.get_objects() if obj.get_type() == 'GraphQLType']
+        info('[GraphQL Application] Schema index: %s queries, %s mutations, %s subscriptions',
+             len(schema_queries), len(schema_mutations), len(schema_subscriptions))
         
-        for type_obj in graphql_types:
-            type_name = type_obj.get_name()
-            
-            if type_name == 'Query':
-                type_obj.load_children()
-                for field_obj in type_obj.get_children():
-                    if field_obj.get_type() == 'GraphQLField':
-                        schema_queries[field_obj.get_name()] = field_obj
-                        
-            elif type_name == 'Mutation':
-                type_obj.load_children()
-                for field_obj in type_obj.get_children():
-                    if field_obj.get_type() == 'GraphQLField':
-                        schema_mutations[field_obj.get_name()] = field_obj
-                        
-            elif type_name == 'Subscription':
-                type_obj.load_children()
-                for field_obj in type_obj.get_children():
-                    if field_obj.get_type() == 'GraphQLField':
-                        schema_subscriptions[field_obj.get_name()] = field_obj
-        
-        info('[GraphQL Application] Schema index: ' + str(len(schema_queries)) + ' queries, ' + 
-             str(len(schema_mutations)) + ' mutations, ' + str(len(schema_subscriptions)) + ' subscriptions')
+        # The clients are still counted without schema fields, to help
+        # diagnose why nothing is linked
+        has_schema_fields = bool(schema_queries or schema_mutations or schema_subscriptions)
         
         links_created = 0
+        total_clients = 0
+        link_client_to_fields = self._link_client_to_fields
+        
+        # Each kind of client definition links to the fields of its operation
+        # type; all kinds are streamed together, in a single query, with
+        # their fieldsSelected property
+        operation_types = dict(CLIENT_OPERATION_TYPES)
+        client_counts = dict.fromkeys(operation_types, 0)
+        clients = application.objects().has_type(list(operation_types))
+        for client_obj in clients.load_property(FIELDS_SELECTED_PROPERTY):
+            client_type = client_obj.get_type()
+            operation_type = operation_types.get(client_type)
+            if operation_type is None:
+                # has_type() also yields the types inheriting from these
+                continue
+            client_counts[client_type] += 1
+            if has_schema_fields:
+                links_created += link_client_to_fields(client_obj, schema_index[operation_type],
+                                                       operation_type, pending_links)
+        
+        for client_type, _ in CLIENT_OPERATION_TYPES:
+            info('[GraphQL Application] Found %s %s objects', client_counts[client_type], client_type)
+            total_clients += client_counts[client_type]
+        
+        if not has_schema_fields:
+            warning('[GraphQL Application] No GraphQL schema fields found - nothing to link to')
+            return
         
-        for client_obj in client_queries:
-            links_created += self._link_client_to_fields(client_obj, schema_queries, 'Query')
-        
-        for client_obj in client_mutations:
-            links_created += self._link_client_to_fields(client_obj, schema_mutations, 'Mutation')
-        
-        for client_obj in client_subscriptions:
-            links_created += self._link_client_to_fields(client_obj, schema_subscriptions, 'Subscription')
+        if total_clients == 0:
+            warning('[GraphQL Application] No client definitions found')
+            return
         
         info('[GraphQL Application] ========================================')
-        info('[GraphQL Application] Created ' + str(links_created) + ' USE links total')
+        info('[GraphQL Application] Found %s USE links total', links_created)
         info('[GraphQL Application] ========================================')
     
-    def _link_client_to_fields(self, client_obj, schema_fields, operation_type):
+    def _link_client_to_fields(self, client_obj, schema_fields, operation_type, pending_links):
         """
         Link a client object to schema fields based on fieldsSelected property.
         
         Args:
             client_obj: GraphQL client object (Query/Mutation/Subscription)
-            schema_fields: Dictionary {field_name: GraphQLField_object}
+            schema_fields: Dictionary {field_name: [GraphQLField_object, ...]}
             operation_type: Operation type ('Query', 'Mutation', 'Subscription')
+            pending_links: List receiving the links to create (see _create_links)
             
         Returns:
-            Number of links created
+            Number of links found
             
         Note:
             The fieldsSelected property is stored as a comma-separated string
@@ -225,39 +396,53 @@ class GraphQLApplicationLevel(ApplicationLevelExtension):
         
         try:
             # Get the property value
-            fields_selected_raw = client_obj.get_property('GraphQL_Client_Definition.fieldsSelected')
-            info('[GraphQL Application] >>> Processing client object: ' + client_obj.get_name())
-            info('[GraphQL Application]     Raw fieldsSelected property: ' + str(fields_selected_raw) + ' (type: ' + str(type(fields_selected_raw)) + ')')
+            fields_selected_raw = client_obj.get_property(FIELDS_SELECTED_PROPERTY)
+            client_name = client_obj.get_name()
+            debug('[GraphQL Application] >>> Processing client object: %s', client_name)
+            debug('[GraphQL Application]     Raw fieldsSelected property: %s (type: %s)', fields_selected_raw, type(fields_selected_raw))
             
             if not fields_selected_raw:
-                warning('[GraphQL Application] No fieldsSelected for ' + client_obj.get_name())
+                warning('[GraphQL Application] No fieldsSelected for %s', client_name)
                 return 0
             
             # The property is saved as a comma-separated string, split it into a list
+            # (str.strip is mapped directly, without a Python-level loop body)
             if isinstance(fields_selected_raw, str):
-                fields_selected = [f.strip() for f in fields_selected_raw.split(',')]
+                fields_selected = list(map(str.strip, fields_selected_raw.split(',')))
             else:
                 fields_selected = fields_selected_raw
             
-            info('[GraphQL Application]     Parsed fields: ' + str(fields_selected))
+            debug('[GraphQL Application]     Parsed fields: %s', fields_selected)
             
+            # Link each selected field once, in selection order; the fields
+            # missing from the schema are reported together
+            seen = set()
+            missing = []
+            add_link = pending_links.append
             for field_name in fields_selected:
-                if field_name in schema_fields:
-                    schema_obj = schema_fields[field_name]
-                    info('[GraphQL Application] >>> LINK: ' + client_obj.get_name() + ' -> ' + 
-                         operation_type + '.' + field_name)
-                    create_link('useLink', client_obj, schema_obj)
-                    links_created += 1
-                else:
-                    warning('[GraphQL Application] Field not found in schema: "' + field_name + '"')
+                if field_name in seen:
+                    continue
+                seen.add(field_name)
+                schema_objs = schema_fields.get(field_name)
+                if schema_objs is None:
+                    missing.append(field_name)
+                    continue
+                debug('[GraphQL Application] >>> LINK: %s -> %s.%s',
+                      client_name, operation_type, field_name)
+                for schema_obj in schema_objs:
+                    add_link(('useLink', client_obj, schema_obj))
+                links_created += len(schema_objs)
+            
+            if missing:
+                warning('[GraphQL Application] Fields not found in schema: %s', missing)
         
         except Exception as e:
-            warning('[GraphQL Application] Error linking: ' + str(e))
-            debug(traceback.format_exc())
+            warning('[GraphQL Application] Error linking: %s', e)
+            debug('[GraphQL Application] Error details', exc_info=True)
         
         return links_created
 
-    def _link_schema_to_backend(self, application):
+    def _link_schema_to_backend(self, application, schema_index, pending_links):
         """
         Create CALL links from GraphQL schema fields to Java backend methods.
         
@@ -287,85 +472,16 @@ class GraphQLApplicationLevel(ApplicationLevelExtension):
         
         Args:
             application: CAST Application object containing all analyzed objects
+            schema_index: Schema fields by operation type (see _build_schema_index)
+            pending_links: List receiving the links to create (see _create_links)
         """
         info('[GraphQL Application] ========================================')
         info('[GraphQL Application] Starting schema-to-backend link creation')
         info('[GraphQL Application] ========================================')
         
-        # Find all Java methods with properties loaded to check annotations
-        debug('[GraphQL Application] Searching for Java methods...')
-        java_methods = [obj for obj in application.search_objects(load_properties=True) if obj.get_type() == 'JV_METHOD']
-        
-        info('[GraphQL Application] Found ' + str(len(java_methods)) + ' JV_METHOD objects')
-        if len(java_methods) > 20:
-            debug('[GraphQL Application]   (Too many to list individually)')
-        else:
-            for obj in java_methods:
-                debug('[GraphQL Application]   - Java Method: "' + obj.get_name() + '" (fullname: ' + str(obj.get_fullname()) + ')')
-        
-        if len(java_methods) == 0:
-            warning('[GraphQL Application] No Java methods found - nothing to link')
-            return
-        
-        # Build index of schema fields for faster lookup
-        info('[GraphQL Application] Building schema field index...')
-        schema_queries = {}
-        schema_mutations = {}
-        schema_subscriptions = {}
-        
-        # Find Query and Mutation types, then load their field children
-        graphql_types = [obj for obj in application.get_objects() if obj.get_type() == 'GraphQLType']
-        debug('[GraphQL Application] Found ' + str(len(graphql_types)) + ' GraphQLType objects')
-        
-        for type_obj in graphql_types:
-            type_name = type_obj.get_name()
-            debug('[GraphQL Application]   - Processing GraphQLType: "' + type_name + '"')
-            
-            if type_name == 'Query':
-                info('[GraphQL Application] Found Query type: ' + str(type_obj.get_fullname()))
-                type_obj.load_children()
-                children = type_obj.get_children()
-                debug('[GraphQL Application]   - Query type has ' + str(len(children)) + ' children')
-                
-                for field_obj in children:
-                    if field_obj.get_type() == 'GraphQLField':
-                        field_name = field_obj.get_name()
-                        schema_queries[field_name] = field_obj
-                        info('[GraphQL Application]   - Indexed query field: "' + field_name + '" (fullname: ' + str(field_obj.get_fullname()) + ')')
-                    else:
-                        debug('[GraphQL Application]   - Skipping non-field child: ' + field_obj.get_type())
-                    
-            elif type_name == 'Mutation':
-                info('[GraphQL Application] Found Mutation type: ' + str(type_obj.get_fullname()))
-                type_obj.load_children()
-                children = type_obj.get_children()
-                debug('[GraphQL Application]   - Mutation type has ' + str(len(children)) + ' children')
-                
-                for field_obj in children:
-                    if field_obj.get_type() == 'GraphQLField':
-                        field_name = field_obj.get_name()
-                        schema_mutations[field_name] = field_obj
-                        info('[GraphQL Application]   - Indexed mutation field: "' + field_name + '" (fullname: ' + str(field_obj.get_fullname()) + ')')
-                    else:
-                        debug('[GraphQL Application]   - Skipping non-field child: ' + field_obj.get_type())
-                    
-            elif type_name == 'Subscription':
-                info('[GraphQL Application] Found Subscription type: ' + str(type_obj.get_fullname()))
-                type_obj.load_children()
-                children = type_obj.get_children()
-                debug('[GraphQL Application]   - Subscription type has ' + str(len(children)) + ' children')
-                
-                for field_obj in children:
-                    if field_obj.get_type() == 'GraphQLField':
-                        field_name = field_obj.get_name()
-                        schema_subscriptions[field_name] = field_obj
-                        info('[GraphQL Application]   - Indexed subscription field: "' + field_name + '" (fullname: ' + str(field_obj.get_fullname()) + ')')
-                    else:
-                        debug('[GraphQL Application]   - Skipping non-field child: ' + field_obj.get_type())
-        
-        info('[GraphQL Application] Schema index complete: ' + str(len(schema_queries)) + 
-                ' query fields, ' + str(len(schema_mutations)) + ' mutation fields, ' + 
-                str(len(schema_subscriptions)) + ' subscription fields')
+        schema_queries = schema_index['Query']
+        schema_mutations = schema_index['Mutation']
+        schema_subscriptions = schema_index['Subscription']
         
         if len(schema_queries) == 0 and len(schema_mutations) == 0 and len(schema_subscriptions) == 0:
             warning('[GraphQL Application] No GraphQL schema fields found - nothing to link to')
@@ -375,114 +491,134 @@ class GraphQLApplicationLevel(ApplicationLevelExtension):
         info('[GraphQL Application] Matching Java methods to schema fields (by name)...')
         info('[GraphQL Application] ----------------------------------------')
         
+        # Parent classes are looked up by name for each method
+        java_classes = self._get_java_classes(application)
+        controller_classes = self._get_controller_classes(java_classes)
+        debug('[GraphQL Application] Found %s @Controller classes', len(controller_classes))
+        
+        if not controller_classes:
+            warning('[GraphQL Application] No @Controller classes found - nothing to link')
+            return
+        
         # Match Java methods to schema fields by name
         links_created = 0
-        queries_matched = 0
-        mutations_matched = 0
-        subscriptions_matched = 0
+        matched = {'Query': 0, 'Mutation': 0, 'Subscription': 0}
         not_matched = 0
         
-        for java_method in java_methods:
+        # Only methods of @Controller classes named after a schema field can
+        # be resolvers: filter them before loading any method annotation
+        field_names = set(schema_queries) | set(schema_mutations) | set(schema_subscriptions)
+        # Java methods are streamed with their annotations and only the
+        # candidates are kept, with their names: [(name, JV_METHOD)]
+        java_method_count = 0
+        candidate_methods = []
+        # Bound once: this loop runs for every Java method of the application
+        get_parent = self._get_parent
+        add_candidate = candidate_methods.append
+        for java_method in application.objects().has_type('JV_METHOD').load_property(ANNOTATION_PROPERTY):
+            # has_type() also yields the types inheriting from JV_METHOD
+            if java_method.get_type() != 'JV_METHOD':
+                continue
+            java_method_count += 1
             try:
-                method_name = java_method.get_name()
-                debug('[GraphQL Application] Processing Java method: "' + method_name + '"')
-                
-                # Get parent class of the Java method
-                parent_class = self._get_parent(java_method, application)
-                
-                # Check if parent class has @Controller annotation
-                if parent_class:
-                    debug('[GraphQL Application]   - Parent class: "' + parent_class.get_fullname() + '"')
-                    parent_annotations = []
-                    try:
-                        parent_annotations = parent_class.get_property("CAST_Java_AnnotationMetrics.Annotation")
-                        if parent_annotations:
-                            debug('[GraphQL Application]   - Parent annotations: ' + str(parent_annotations))
-                    except:
-                        pass  # No annotations or property not loaded
-                    
-                    # Skip if parent class doesn't have @Controller annotation
-                    has_controller = any('@Controller' in str(ann) for ann in parent_annotations) if parent_annotations else False
-                    if not has_controller:
-                        debug('[GraphQL Application]   - Skipping: Parent class does not have @Controller annotation')
-                        continue
-                else:
-                    debug('[GraphQL Application]   - Warning: Could not find parent class, skipping method')
+                if get_parent(java_method, controller_classes) is None:
                     continue
-                
-                # Get method annotations to reduce false positives
-                annotations = []
-                try:
-                    annotations = java_method.get_property("CAST_Java_AnnotationMetrics.Annotation")
-                    if annotations:
-                        debug('[GraphQL Application]   - Annotations: ' + str(annotations))
-                except:
-                    pass  # No annotations or property not loaded
-                
-                # Try to match with Query fields first
-                if method_name in schema_queries:
-                    # Check if method has @QueryMapping annotation
-                    has_query_mapping = any('@QueryMapping' in str(ann) for ann in annotations) if annotations else False
-                    
-                    if has_query_mapping:
-                        schema_obj = schema_queries[method_name]
-                        info('[GraphQL Application] >>> CREATING LINK: callLink')
-                        info('[GraphQL Application]     FROM (schema):  ' + str(schema_obj.get_fullname()) + ' [' + schema_obj.get_type() + ']')
-                        info('[GraphQL Application]     TO (backend):   ' + str(java_method.get_fullname()) + ' [' + java_method.get_type() + ']')
-                        info('[GraphQL Application]     ANNOTATION: ' + str([ann for ann in annotations if '@QueryMapping' in str(ann)]))
-                        create_link('callLink', schema_obj, java_method)
-                        links_created += 1
-                        queries_matched += 1
-                    else:
-                        debug('[GraphQL Application]   - Skipping: No @QueryMapping annotation found')
-                
-                # Try to match with Mutation fields
-                elif method_name in schema_mutations:
-                    # Check if method has @MutationMapping annotation
-                    has_mutation_mapping = any('@MutationMapping' in str(ann) for ann in annotations) if annotations else False
-                    
-                    if has_mutation_mapping:
-                        schema_obj = schema_mutations[method_name]
-                        info('[GraphQL Application] >>> CREATING LINK: callLink')
-                        info('[GraphQL Application]     FROM (schema):  ' + str(schema_obj.get_fullname()) + ' [' + schema_obj.get_type() + ']')
-                        info('[GraphQL Application]     TO (backend):   ' + str(java_method.get_fullname()) + ' [' + java_method.get_type() + ']')
-                        info('[GraphQL Application]     ANNOTATION: ' + str([ann for ann in annotations if '@MutationMapping' in str(ann)]))
-                        create_link('callLink', schema_obj, java_method)
-                        links_created += 1
-                        mutations_matched += 1
-                    else:
-                        debug('[GraphQL Application]   - Skipping: No @MutationMapping annotation found')
-                
-                # Try to match with Subscription fields
-                elif method_name in schema_subscriptions:
-                    # Check if method has @SubscriptionMapping annotation
-                    has_subscription_mapping = any('@SubscriptionMapping' in str(ann) for ann in annotations) if annotations else False
-                    
-                    if has_subscription_mapping:
-                        schema_obj = schema_subscriptions[method_name]
-                        info('[GraphQL Application] >>> CREATING LINK: callLink')
-                        info('[GraphQL Application]     FROM (schema):  ' + str(schema_obj.get_fullname()) + ' [' + schema_obj.get_type() + ']')
-                        info('[GraphQL Application]     TO (backend):   ' + str(java_method.get_fullname()) + ' [' + java_method.get_type() + ']')
-                        info('[GraphQL Application]     ANNOTATION: ' + str([ann for ann in annotations if '@SubscriptionMapping' in str(ann)]))
-                        create_link('callLink', schema_obj, java_method)
-                        links_created += 1
-                        subscriptions_matched += 1
-                    else:
-                        debug('[GraphQL Application]   - Skipping: No @SubscriptionMapping annotation found')
-                
-                else:
+                method_name = java_method.get_name()
+                if method_name not in field_names:
                     # No match found - this is expected for most Java methods
-                    debug('[GraphQL Application] No match for Java method: "' + method_name + '"')
                     not_matched += 1
+                    continue
+                add_candidate((method_name, java_method))
+            except Exception as e:
+                # An unreadable method is skipped, the others are still linked
+                warning('[GraphQL Application] !!! ERROR reading Java method %s: %s', java_method, e)
+                debug('[GraphQL Application] Error details', exc_info=True)
+        
+        info('[GraphQL Application] Found %s JV_METHOD objects', java_method_count)
+        if java_method_count == 0:
+            warning('[GraphQL Application] No Java methods found - nothing to link')
+            return
+        
+        debug('[GraphQL Application] %s candidate resolver methods', len(candidate_methods))
+        
+        # The link details are only built when they are logged
+        log_debug = _debug_enabled()
+        for method_name, java_method in candidate_methods:
+            try:
+                match = self._match_resolver(method_name, java_method, schema_index)
+                if match is None:
+                    continue
+                
+                operation_type, mapping, schema_objs, annotations = match
+                if log_debug:
+                    # Shared by the links of all the fields of that name
+                    method_fullname = java_method.get_fullname()
+                    method_type = java_method.get_type()
+                    mapping_annotations = [ann for ann in annotations if mapping in str(ann)]
+                for schema_obj in schema_objs:
+                    if log_debug:
+                        debug('[GraphQL Application] >>> FOUND LINK: callLink')
+                        debug('[GraphQL Application]     FROM (schema):  %s [%s]', schema_obj.get_fullname(), schema_obj.get_type())
+                        debug('[GraphQL Application]     TO (backend):   %s [%s]', method_fullname, method_type)
+                        debug('[GraphQL Application]     ANNOTATION: %s', mapping_annotations)
+                    pending_links.append(('callLink', schema_obj, java_method))
+                links_created += len(schema_objs)
+                matched[operation_type] += 1
                     
             except Exception as e:
-                warning('[GraphQL Application] !!! ERROR linking Java method "' + java_method.get_name() + '": ' + str(e))
-                debug('[GraphQL Application] ' + traceback.format_exc())
+                warning('[GraphQL Application] !!! ERROR linking Java method "%s": %s', method_name, e)
+                debug('[GraphQL Application] Error details', exc_info=True)
         
         info('[GraphQL Application] ========================================')
-        info('[GraphQL Application] SCHEMA-BACKEND LINKING SUMMARY: Created ' + str(links_created) + ' CALL links')
-        info('[GraphQL Application]   - Query methods:        ' + str(queries_matched) + ' linked')
-        info('[GraphQL Application]   - Mutation methods:     ' + str(mutations_matched) + ' linked')
-        info('[GraphQL Application]   - Subscription methods: ' + str(subscriptions_matched) + ' linked')
-        info('[GraphQL Application]   - Not matched:          ' + str(not_matched) + ' (expected - most Java methods are not GraphQL resolvers)')
-        info('[GraphQL Application] ========================================')
\ No newline at end of file
+        info('[GraphQL Application] SCHEMA-BACKEND LINKING SUMMARY: Found %s CALL links', links_created)
+        info('[GraphQL Application]   - Query methods:        %s linked', matched['Query'])
+        info('[GraphQL Application]   - Mutation methods:     %s linked', matched['Mutation'])
+        info('[GraphQL Application]   - Subscription methods: %s linked', matched['Subscription'])
+        info('[GraphQL Application]   - Not matched:          %s (expected - most Java methods are not GraphQL resolvers)', not_matched)
+        info('[GraphQL Application] ========================================')
+
+    def _match_resolver(self, method_name, java_method, schema_index):
+        """
+        Find the schema field resolved by a candidate Java method.
+        
+        Only reads the method annotations: the link itself is created by the
+        caller (see _link_schema_to_backend()).
+        
+        Args:
+            method_name: Name of the Java method
+            java_method: JV_METHOD object, with its annotations loaded
+            schema_index: Schema fields by operation type (see _build_schema_index)
+            
+        Returns:
+            tuple: (operation_type, mapping, schema_objs, annotations), where
+            schema_objs lists the fields of that name, or None if the method
+            does not have the annotation of the matching field
+        """
+        debug('[GraphQL Application] Processing Java method: "%s"', method_name)
+        
+        # Get method annotations to reduce false positives (already
+        # loaded with the method, no knowledge base access)
+        annotations = []
+        try:
+            annotations = java_method.get_property(ANNOTATION_PROPERTY)
+            if annotations:
+                debug('[GraphQL Application]   - Annotations: %s', annotations)
+        except Exception:
+            pass  # No annotations or property not loaded
+        
+        annotation_names = self._get_annotation_names(annotations)
+        
+        # Try to match with Query fields first, then Mutation and
+        # Subscription; the method must have the matching annotation
+        for operation_type, mapping in RESOLVER_MAPPINGS:
+            schema_objs = schema_index[operation_type].get(method_name)
+            if schema_objs is None:
+                continue
+            
+            if mapping in annotation_names:
+                return operation_type, mapping, schema_objs, annotations
+            
+            debug('[GraphQL Application]   - Skipping: No %s annotation found', mapping)
+            return None
+        
+        return None
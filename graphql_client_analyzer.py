@@ -23,6 +23,28 @@ from cast.analysers import ua, log, CustomObject, Bookmark, create_link
 from cast import Event
 
 
+# Client definition object type of each GraphQL operation type
+CLIENT_OBJECT_TYPES = {
+    'query': 'GraphQLClientQuery',
+    'mutation': 'GraphQLClientMutation',
+    'subscription': 'GraphQLClientSubscription',
+}
+
+# Request object type of each Apollo Client hook executing a GraphQL operation
+REQUEST_OBJECT_TYPES = {
+    'useQuery': 'GraphQLQueryRequest',
+    'useLazyQuery': 'GraphQLLazyQueryRequest',
+    'useMutation': 'GraphQLMutationRequest',
+    'useSubscription': 'GraphQLSubscriptionRequest',
+}
+
+# Apollo Client hooks executing a GraphQL operation
+APOLLO_HOOKS = frozenset(REQUEST_OBJECT_TYPES)
+
+# Imported names marking a file as using GraphQL
+GRAPHQL_IMPORTS = APOLLO_HOOKS | frozenset(['gql'])
+
+
 def is_function_call(ast):
     """Check if AST node is a function call."""
     try:
@@ -58,7 +80,7 @@ class GraphQLClientAnalyzer(ua.Extension):
         FunctionCallPart (e.g., useQuery(...)) has direct access to parameters.
         """
         try:
-            log.info('[GraphQL Client] _get_function_parameters: ast type=' + str(type(ast)))
+            log.debug('[GraphQL Client] _get_function_parameters: ast type=' + str(type(ast)))
             
             # Case 1: FunctionCall (has get_function_call_parts())
             if is_function_call(ast):
@@ -86,11 +108,11 @@ class GraphQLClientAnalyzer(ua.Extension):
                 log.info('[GraphQL Client]   -> Extracted ' + str(len(params)) + ' parameters')
                 return params
             
-            log.info('[GraphQL Client]   -> No known method to extract parameters from type: ' + str(type(ast)))
+            log.debug('[GraphQL Client]   -> No known method to extract parameters from type: ' + str(type(ast)))
             return []
         except Exception as e:
             log.info('[GraphQL Client] Error in _get_function_parameters: ' + str(e))
-            log.info('[GraphQL Client] ' + traceback.format_exc())
+            log.debug('[GraphQL Client] ' + traceback.format_exc())
             return []
     
     @Event('com.castsoftware.html5', 'start_javascript_content')
@@ -103,29 +125,31 @@ class GraphQLClientAnalyzer(ua.Extension):
         """
         try:
             file_path = str(jsContent.get_file().get_path())
-            log.info('[GraphQL Client] Processing file: ' + file_path)
+            
+            log.debug('[GraphQL Client] Processing file: ' + file_path)
             
             # Log jsContent structure for local testing
-            log.info('[GraphQL Client] jsContent type: ' + str(type(jsContent)))
-            log.info('[GraphQL Client] jsContent methods: ' + str(dir(jsContent)))
+            log.debug('[GraphQL Client] jsContent type: ' + str(type(jsContent)))
+            log.debug('[GraphQL Client] jsContent methods: ' + str(dir(jsContent)))
             
-            # Check imports for GraphQL-related symbols
-            imports = jsContent.get_imports()
-            log.info('[GraphQL Client] Found ' + str(len(list(imports))) + ' imports')
+            # Check imports for GraphQL-related symbols; the imports are
+            # read once, both to count and to filter them
+            imports = list(jsContent.get_imports())
+            log.debug('[GraphQL Client] Found ' + str(len(imports)) + ' imports')
             
-            for _import in jsContent.get_imports():
+            for _import in imports:
                 import_name = _import.get_what_name()
-                log.info('[GraphQL Client]   - Import: ' + str(import_name))
+                log.debug('[GraphQL Client]   - Import: ' + str(import_name))
                 
                 # Filter: only process files that use Apollo Client or gql
-                if import_name in ['useQuery', 'useLazyQuery', 'useMutation', 'useSubscription', 'gql']:
+                if import_name in GRAPHQL_IMPORTS:
                     self.graphql_jscontent.append(jsContent)
                     log.info('[GraphQL Client] ✓ File added for processing: ' + file_path)
                     break
                     
         except Exception as e:
             log.info('[GraphQL Client] Error in start_javascript_content: ' + str(e))
-            log.info('[GraphQL Client] ' + traceback.format_exc())
+            log.debug('[GraphQL Client] ' + traceback.format_exc())
     
     @Event('com.castsoftware.html5', 'end_javascript_contents')
     def on_end_javascript_contents(self):
@@ -159,42 +183,43 @@ class GraphQLClientAnalyzer(ua.Extension):
             log.info('[GraphQL Client] ========================================')
             
             # Debug: Print full jscontent structure
-            log.info('[GraphQL Client] === JSCONTENT INSPECTION ===')
-            log.info('[GraphQL Client] jscontent type: ' + str(type(jscontent)))
-            log.info('[GraphQL Client] jscontent dir: ' + str([m for m in dir(jscontent) if not m.startswith('_')]))
+            log.debug('[GraphQL Client] === JSCONTENT INSPECTION ===')
+            log.debug('[GraphQL Client] jscontent type: ' + str(type(jscontent)))
+            log.debug('[GraphQL Client] jscontent dir: ' + str([m for m in dir(jscontent) if not m.startswith('_')]))
             
             # Try to get children
             try:
                 children = jscontent.get_children()
-                log.info('[GraphQL Client] jscontent.get_children() count: ' + str(len(list(children))))
+                log.debug('[GraphQL Client] jscontent.get_children() count: ' + str(len(list(children))))
                 children = jscontent.get_children()  # Re-get since we consumed it
                 if children:
                     for idx, child in enumerate(children):
                         if idx < 5:  # Limit to first 5
-                            log.info('[GraphQL Client]   Child ' + str(idx) + ': type=' + str(type(child)) + ', name=' + str(getattr(child, 'get_name', lambda: 'N/A')()))
+                            log.debug('[GraphQL Client]   Child ' + str(idx) + ': type=' + str(type(child)) + ', name=' + str(getattr(child, 'get_name', lambda: 'N/A')()))
             except Exception as e:
-                log.info('[GraphQL Client] Error getting children: ' + str(e))
+                log.debug('[GraphQL Client] Error getting children: ' + str(e))
             
             # Try to get file content
             try:
                 file_obj = jscontent.get_file()
-                log.info('[GraphQL Client] file object: ' + str(file_obj))
-                log.info('[GraphQL Client] file path: ' + str(file_obj.get_path()))
+                log.debug('[GraphQL Client] file object: ' + str(file_obj))
+                log.debug('[GraphQL Client] file path: ' + str(file_obj.get_path()))
             except Exception as e:
-                log.info('[GraphQL Client] Error getting file: ' + str(e))
+                log.debug('[GraphQL Client] Error getting file: ' + str(e))
             
-            log.info('[GraphQL Client] === END JSCONTENT INSPECTION ===')
+            log.debug('[GraphQL Client] === END JSCONTENT INSPECTION ===')
             
             # LEVEL 1: Extract gql`...` definitions
             # Creates GraphQLClientQuery/Mutation/Subscription objects
             log.info('[GraphQL Client] LEVEL 1: Extracting gql definitions...')
             
             # Debug: Check if we have a valid AST root
-            root = jscontent.get_children()[0] if jscontent.get_children() else None
-            log.info('[GraphQL Client] AST root: ' + str(root))
-            log.info('[GraphQL Client] AST root type: ' + str(type(root) if root else 'None'))
+            children = jscontent.get_children()
+            root = children[0] if children else None
+            log.debug('[GraphQL Client] AST root: ' + str(root))
+            log.debug('[GraphQL Client] AST root type: ' + str(type(root) if root else 'None'))
             if root:
-                log.info('[GraphQL Client] AST root has ' + str(len(list(root.get_children()))) + ' children')
+                log.debug('[GraphQL Client] AST root has ' + str(len(list(root.get_children()))) + ' children')
             
             gql_defs = self._extract_gql_definitions(jscontent)
             log.info('[GraphQL Client] Found ' + str(len(gql_defs)) + ' gql definitions')
@@ -215,7 +240,7 @@ class GraphQLClientAnalyzer(ua.Extension):
                 
         except Exception as e:
             log.info('[GraphQL Client] Error processing content: ' + str(e))
-            log.info('[GraphQL Client] ' + traceback.format_exc())
+            log.debug('[GraphQL Client] ' + traceback.format_exc())
     
     def _extract_gql_definitions(self, jscontent):
         """LEVEL 1: Extract gql`...` definitions."""
@@ -224,7 +249,7 @@ class GraphQLClientAnalyzer(ua.Extension):
         # BUGFIX: Traverse ALL children, not just the first one
         log.info('[GraphQL Client] Traversing all jscontent children for gql definitions...')
         for idx, child in enumerate(jscontent.get_children()):
-            log.info('[GraphQL Client]   Searching child ' + str(idx) + ': ' + str(type(child)))
+            log.debug('[GraphQL Client]   Searching child ' + str(idx) + ': ' + str(type(child)))
             self._find_gql_definitions(child, definitions)
         
         return definitions
@@ -246,9 +271,9 @@ class GraphQLClientAnalyzer(ua.Extension):
             
             # Log when we find 'gql' anywhere
             if node_name == 'gql':
-                log.info('[GraphQL Client] >>> Found node named "gql", is_function_call=' + str(is_call))
-                log.info('[GraphQL Client]     Node type: ' + str(type(ast)))
-                log.info('[GraphQL Client]     Node methods: ' + str([m for m in dir(ast) if not m.startswith('_')]))
+                log.debug('[GraphQL Client] >>> Found node named "gql", is_function_call=' + str(is_call))
+                log.debug('[GraphQL Client]     Node type: ' + str(type(ast)))
+                log.debug('[GraphQL Client]     Node methods: ' + str([m for m in dir(ast) if not m.startswith('_')]))
             
             if is_call and node_name == 'gql':
                 log.info('[GraphQL Client] ✓ FOUND gql definition!')
@@ -297,13 +322,8 @@ class GraphQLClientAnalyzer(ua.Extension):
             
             # Step 3: Determine object type based on operation type
             op_type = operation_data['type']
-            if op_type == 'query':
-                object_type = 'GraphQLClientQuery'
-            elif op_type == 'mutation':
-                object_type = 'GraphQLClientMutation'
-            elif op_type == 'subscription':
-                object_type = 'GraphQLClientSubscription'
-            else:
+            object_type = CLIENT_OBJECT_TYPES.get(op_type)
+            if object_type is None:
                 log.info('[GraphQL Client] Unknown operation type: ' + str(op_type))
                 return
             
@@ -378,7 +398,7 @@ class GraphQLClientAnalyzer(ua.Extension):
             
         except Exception as e:
             log.info('[GraphQL Client] Error creating definition: ' + str(e))
-            log.info('[GraphQL Client] ' + traceback.format_exc())
+            log.debug('[GraphQL Client] ' + traceback.format_exc())
     
     def _extract_apollo_hooks(self, jscontent):
         """LEVEL 2: Extract Apollo hook calls."""
@@ -387,7 +407,7 @@ class GraphQLClientAnalyzer(ua.Extension):
         # BUGFIX: Traverse ALL children, not just the first one
         log.info('[GraphQL Client] Traversing all jscontent children for Apollo hooks...')
         for idx, child in enumerate(jscontent.get_children()):
-            log.info('[GraphQL Client]   Searching child ' + str(idx) + ': ' + str(type(child)))
+            log.debug('[GraphQL Client]   Searching child ' + str(idx) + ': ' + str(type(child)))
             self._find_apollo_hooks(child, hooks)
         
         return hooks
@@ -408,11 +428,11 @@ class GraphQLClientAnalyzer(ua.Extension):
             is_call_part = is_function_call_part(ast)
             
             # Log when we find hook names anywhere
-            if node_name in ['useQuery', 'useLazyQuery', 'useMutation', 'useSubscription']:
-                log.info('[GraphQL Client] >>> Found node named "' + node_name + '", is_function_call_part=' + str(is_call_part))
-                log.info('[GraphQL Client]     Node type: ' + str(type(ast)))
+            if node_name in APOLLO_HOOKS:
+                log.debug('[GraphQL Client] >>> Found node named "' + node_name + '", is_function_call_part=' + str(is_call_part))
+                log.debug('[GraphQL Client]     Node type: ' + str(type(ast)))
             
-            if is_call_part and node_name in ['useQuery', 'useLazyQuery', 'useMutation', 'useSubscription']:
+            if is_call_part and node_name in APOLLO_HOOKS:
                 log.info('[GraphQL Client] ✓ FOUND Apollo hook: ' + node_name)
                 results.append(ast)
             
@@ -454,15 +474,8 @@ class GraphQLClientAnalyzer(ua.Extension):
             log.info('[GraphQL Client] Query name: ' + query_name)
             
             # Step 2: Determine object type based on hook type
-            if hook_name == 'useQuery':
-                object_type = 'GraphQLQueryRequest'
-            elif hook_name == 'useLazyQuery':
-                object_type = 'GraphQLLazyQueryRequest'
-            elif hook_name == 'useMutation':
-                object_type = 'GraphQLMutationRequest'
-            elif hook_name == 'useSubscription':
-                object_type = 'GraphQLSubscriptionRequest'
-            else:
+            object_type = REQUEST_OBJECT_TYPES.get(hook_name)
+            if object_type is None:
                 log.info('[GraphQL Client] Unknown hook type: ' + hook_name)
                 return
             
@@ -557,41 +570,44 @@ class GraphQLClientAnalyzer(ua.Extension):
             
         except Exception as e:
             log.info('[GraphQL Client] Error creating request: ' + str(e))
-            log.info('[GraphQL Client] ' + traceback.format_exc())
+            log.debug('[GraphQL Client] ' + traceback.format_exc())
     
     def _extract_gql_text(self, gql_ast):
         """Extract GraphQL text from gql template literal."""
         try:
             log.info('[GraphQL Client] >>> _extract_gql_text: Starting extraction')
-            log.info('[GraphQL Client]     gql_ast type: ' + str(type(gql_ast)))
+            log.debug('[GraphQL Client]     gql_ast type: ' + str(type(gql_ast)))
             
             params = self._get_function_parameters(gql_ast)
-            log.info('[GraphQL Client]     _get_function_parameters() returned: ' + str(type(params)) + ' with ' + str(len(params) if params else 0) + ' items')
+            log.debug('[GraphQL Client]     _get_function_parameters() returned: ' + str(type(params)) + ' with ' + str(len(params) if params else 0) + ' items')
             
             if not params:
                 log.info('[GraphQL Client]     ✗ No parameters found in gql call')
                 return None
             
             text_param = params[0]
-            log.info('[GraphQL Client]     First parameter type: ' + str(type(text_param)))
-            log.info('[GraphQL Client]     First parameter methods: ' + str([m for m in dir(text_param) if not m.startswith('_')][:20]))
+            log.debug('[GraphQL Client]     First parameter type: ' + str(type(text_param)))
+            log.debug('[GraphQL Client]     First parameter methods: ' + str([m for m in dir(text_param) if not m.startswith('_')][:20]))
             
+            # Evaluated once: the result may be a one-shot iterator
             evs = text_param.evaluate()
-            log.info('[GraphQL Client]     evaluate() returned: ' + str(type(evs)) + ' with ' + str(len(list(evs)) if evs else 0) + ' items')
+            evs = list(evs) if evs else []
+            log.info('[GraphQL Client]     evaluate() returned ' + str(len(evs)) + ' items')
             
             if not evs:
                 log.info('[GraphQL Client]     ✗ No evaluations returned from text_param.evaluate()')
                 return None
             
-            evs = text_param.evaluate()  # Re-evaluate since we consumed the iterator
             for idx, ev in enumerate(evs):
-                log.info('[GraphQL Client]       Evaluation ' + str(idx) + ': type=' + str(type(ev)) + ', str=' + str(ev)[:100])
-                text = str(ev).strip('`').strip()
+                ev_text = str(ev)
+                log.debug('[GraphQL Client]       Evaluation ' + str(idx) + ': type=' + str(type(ev)) + ', str=' + ev_text[:100])
+                text = ev_text.strip('`').strip()
                 
                 # Clean CAST metadata (tab-separated values after the GraphQL text)
                 # Example: "query { ... }\t0 ; 0\t0\t\t0\t[Module name]"
-                if '\t' in text:
-                    text = text.split('\t')[0].strip()
+                head, sep, _ = text.partition('\t')
+                if sep:
+                    text = head.strip()
                     log.info('[GraphQL Client]       Cleaned metadata from text')
                 
                 if text:
@@ -602,14 +618,14 @@ class GraphQLClientAnalyzer(ua.Extension):
             return None
         except Exception as e:
             log.info('[GraphQL Client]     ✗ Exception in _extract_gql_text: ' + str(e))
-            log.info('[GraphQL Client]     ' + traceback.format_exc())
+            log.debug('[GraphQL Client]     ' + traceback.format_exc())
             return None
     
     def _get_variable_name(self, gql_ast):
         """Get the variable name for gql definition (e.g., GET_USERS)."""
         try:
             log.info('[GraphQL Client] >>> _get_variable_name: Starting extraction')
-            log.info('[GraphQL Client]     gql_ast type: ' + str(type(gql_ast)))
+            log.debug('[GraphQL Client]     gql_ast type: ' + str(type(gql_ast)))
             
             # Navigate up the AST tree to find the variable name
             # For: const GET_USERS = gql`...`
@@ -622,8 +638,7 @@ class GraphQLClientAnalyzer(ua.Extension):
                     log.info('[GraphQL Client]     Level ' + str(level) + ': No parent found')
                     break
                 
-                parent_type = str(type(parent).__name__)
-                log.info('[GraphQL Client]     Level ' + str(level) + ': parent type=' + parent_type)
+                log.debug('[GraphQL Client]     Level ' + str(level) + ': parent type=' + type(parent).__name__)
                 
                 # Check if parent is an Assignment
                 if hasattr(parent, 'is_assignment') and parent.is_assignment():
@@ -654,7 +669,7 @@ class GraphQLClientAnalyzer(ua.Extension):
         except Exception as e:
             fallback = 'anonymous_gql_' + str(id(gql_ast))
             log.info('[GraphQL Client]     ✗ Exception in _get_variable_name: ' + str(e))
-            log.info('[GraphQL Client]     ' + traceback.format_exc())
+            log.debug('[GraphQL Client]     ' + traceback.format_exc())
             log.info('[GraphQL Client]     Using fallback: ' + fallback)
             return fallback
     
@@ -662,7 +677,7 @@ class GraphQLClientAnalyzer(ua.Extension):
         """Extract query variable name from hook parameter."""
         try:
             log.info('[GraphQL Client] >>> _get_query_name_from_param: Starting extraction')
-            log.info('[GraphQL Client]     param_ast type: ' + str(type(param_ast)))
+            log.debug('[GraphQL Client]     param_ast type: ' + str(type(param_ast)))
             
             if hasattr(param_ast, 'get_name'):
                 name = param_ast.get_name()
@@ -676,7 +691,7 @@ class GraphQLClientAnalyzer(ua.Extension):
             
             if evs:
                 for idx, ev in enumerate(evs):
-                    log.info('[GraphQL Client]       Evaluation ' + str(idx) + ': type=' + str(type(ev)))
+                    log.debug('[GraphQL Client]       Evaluation ' + str(idx) + ': type=' + str(type(ev)))
                     if hasattr(ev, 'get_name'):
                         name = ev.get_name()
                         log.info('[GraphQL Client]       ev.get_name(): ' + str(name))
@@ -688,7 +703,7 @@ class GraphQLClientAnalyzer(ua.Extension):
             return None
         except Exception as e:
             log.info('[GraphQL Client]     ✗ Exception in _get_query_name_from_param: ' + str(e))
-            log.info('[GraphQL Client]     ' + traceback.format_exc())
+            log.debug('[GraphQL Client]     ' + traceback.format_exc())
             return None
     
     def _extract_hook_options(self, params):
@@ -745,7 +760,7 @@ class GraphQLClientAnalyzer(ua.Extension):
     def _get_file_parent(self, jscontent):
         """Get file-level parent KB object."""
         try:
-            log.info('[GraphQL Client] _get_file_parent: jscontent type=' + str(type(jscontent)))
+            log.debug('[GraphQL Client] _get_file_parent: jscontent type=' + str(type(jscontent)))
             
             # Option 1: Try to get JavaScript initialisation (preferred for JsContent)
             if hasattr(jscontent, 'create_javascript_initialisation'):
@@ -774,7 +789,7 @@ class GraphQLClientAnalyzer(ua.Extension):
             log.info('[GraphQL Client]   -> No valid parent KB object found')
         except Exception as e:
             log.info('[GraphQL Client] Error in _get_file_parent: ' + str(e))
-            log.info('[GraphQL Client] ' + traceback.format_exc())
+            log.debug('[GraphQL Client] ' + traceback.format_exc())
         return None
     
     def _parse_operation(self, graphql_text):
@@ -846,7 +861,7 @@ class GraphQLClientAnalyzer(ua.Extension):
             
         except Exception as e:
             log.info('[GraphQL Client] Error parsing operation: ' + str(e))
-            log.info('[GraphQL Client] ' + traceback.format_exc())
+            log.debug('[GraphQL Client] ' + traceback.format_exc())
             return None
     
     def _extract_fields(self, graphql_text):
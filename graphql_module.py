@@ -26,6 +26,8 @@ Python 3.4+ compatible.
 from cast.analysers import log, CustomObject, create_link, Bookmark
 import os
 import re
+import sys
+import traceback
 from collections import defaultdict
 
 
@@ -72,6 +74,21 @@ for obj_type, obj_def in OBJECTS_CONFIG.items():
 # Build parent hierarchy for containment tracking
 OBJECT_PARENTS = {obj_type: obj_def['parent'] for obj_type, obj_def in OBJECTS_CONFIG.items()}
 
+# Phase 1 line prefilter (see GraphQLModule._build_light_ast): apart from
+# letters, the only characters a structure pattern can start with, after
+# leading whitespace. Keep in sync with _get_structure_patterns(); checked by
+# TestLightAstPrefilter in tests/test_graphql.py.
+_PATTERN_INITIALS = frozenset('"{.$')
+
+# Phase 2 type reference detection (see GraphQLModule._iter_type_references)
+# fieldName(arg: ArgType, ...): ReturnType
+_FIELD_WITH_ARGS_RE = re.compile(r'^\s*([a-z][A-Za-z0-9_]*)\s*\(([^)]+)\)\s*:')
+# argName: ArgType or argName: ArgType!
+_ARG_TYPE_RE = re.compile(r'([a-z][A-Za-z0-9_]*)\s*:\s*\[?([A-Z][A-Za-z0-9_]+)')
+
+# GraphQL built-in scalar types, never linked
+BUILTIN_SCALARS = frozenset(['String', 'Int', 'Float', 'Boolean', 'ID'])
+
 
 # =============================================================================
 # PARSER REGISTRY - Extensibility point for custom parsers
@@ -175,6 +192,42 @@ class GraphQLLibrary:
         """Get all modules in the library."""
         return self.modules
     
+    def process_all(self):
+        """
+        PHASE 2: Process every module of the library in one call.
+        
+        For each module, runs process() against this library and cleans up
+        its AST. A failing module is logged and counted, and does not stop
+        the processing of the others.
+        
+        Returns:
+            tuple: (total_objects, total_links, errors)
+        """
+        total_objects = 0
+        total_links = 0
+        errors = 0
+        
+        for module in self.modules:
+            try:
+                log.debug('[GraphQL] Full parsing: ' + module.path)
+                
+                # Count objects created in Pass 1
+                total_objects += len(module.objects)
+                
+                # Detect, resolve and save links
+                total_links += module.process(self)
+                
+                # Clean up AST to free memory
+                module.clean_ast()
+                
+            except Exception as e:
+                errors += 1
+                log.warning('[GraphQL] Error during full parse of ' + 
+                           module.path + ': ' + str(e))
+                log.debug('[GraphQL] ' + traceback.format_exc())
+        
+        return total_objects, total_links, errors
+    
     def register_symbol(self, fullname, obj, short_name=None):
         """
         Register a symbol in the global symbol table.
@@ -298,6 +351,9 @@ class ASTNode:
         properties (dict): Additional node-specific properties
     """
     
+    __slots__ = ('type', 'name', 'start_line', 'end_line', 'children',
+                 'properties', 'parent')
+    
     def __init__(self, node_type, name=None, start_line=0, end_line=0):
         self.type = node_type
         self.name = name
@@ -349,10 +405,20 @@ class GraphQLModule:
         file: CAST File object
         ast (ASTNode): Parsed AST (available after light_parse)
         objects (dict): Created CAST objects {fullname: CustomObject}
+        object_types (dict): Type name of each created object {fullname: type}
         pending_links (list): Links to create during resolution
         imported_symbols (dict): Tracked imports {name: fullname}
     """
     
+    __slots__ = ('path', 'file', '_basename', 'ast', 'source_content',
+                 'cleaned_source', 'objects', 'objects_by_type', 'object_types',
+                 'object_lines', 'pending_links', 'unresolved_calls',
+                 'imported_symbols', 'import_statements', 'program',
+                 '_short_names')
+    
+    # Compiled structure patterns, shared by all modules (see _get_structure_patterns)
+    _compiled_structure_patterns = None
+    
     def __init__(self, path, file=None):
         """
         Initialize a module for a source file.
@@ -361,8 +427,10 @@ class GraphQLModule:
             path (str): Full path to the source file
             file: CAST File object (from start_file callback)
         """
-        self.path = path
+        self.path = sys.intern(path)
         self.file = file
+        # File name, computed once (used by naming and summary logging)
+        self._basename = os.path.basename(path)
         self.ast = None
         self.source_content = None
         self.cleaned_source = None  # Source with strings/comments removed
@@ -370,6 +438,7 @@ class GraphQLModule:
         # Object storage
         self.objects = {}  # {fullname: CustomObject}
         self.objects_by_type = defaultdict(list)  # {type: [objects]}
+        self.object_types = {}  # {fullname: type} reverse of objects_by_type
         self.object_lines = {}  # {fullname: (start_line, end_line)} for caller resolution
         
         # Links to create during resolution
@@ -391,11 +460,11 @@ class GraphQLModule:
     
     def get_base_name(self):
         """Get the base filename without extension."""
-        return os.path.splitext(os.path.basename(self.path))[0]
+        return os.path.splitext(self._basename)[0]
     
     def get_filename(self):
         """Get the filename with extension."""
-        return os.path.basename(self.path)
+        return self._basename
     
     # =========================================================================
     # SOURCE CLEANING - Remove strings and comments before parsing
@@ -618,6 +687,9 @@ class GraphQLModule:
         3. Extracts global elements (classes, functions, etc.)
         4. Creates CAST objects for discovered elements
         
+        The AST is released afterwards: only the source text, the created
+        objects and their line ranges are kept until Phase 2.
+        
         Override _build_light_ast() and _extract_globals() for custom logic.
         """
         log.debug('[GraphQL] Light parsing: ' + self.path)
@@ -633,6 +705,10 @@ class GraphQLModule:
         
         # Extract global structures
         self._extract_globals()
+        
+        # Do not keep every file's AST in memory until Phase 2; the source
+        # is still needed to detect the links
+        self.ast = None
     
     def _read_source(self):
         """Read the source file content."""
@@ -643,7 +719,7 @@ class GraphQLModule:
             # Fallback to latin-1 for non-UTF8 files
             with open(self.path, 'r', encoding='latin-1') as f:
                 self.source_content = f.read()
-        except Exception as e:
+        except OSError as e:
             log.warning('[GraphQL] Failed to read file: ' + str(e))
             self.source_content = ''
     
@@ -654,9 +730,15 @@ class GraphQLModule:
         These patterns are configurable via config_input.json grammar section.
         Multiple patterns per object type are supported.
         
+        The patterns are compiled on the first call and reused afterwards.
+        
         Returns:
             dict: {node_type: [list of compiled_regex_patterns]}
         """
+        # Compiled by a previous module: do not rebuild the raw patterns either
+        if GraphQLModule._compiled_structure_patterns is not None:
+            return GraphQLModule._compiled_structure_patterns
+        
         # Patterns defined in config_input.json - multiple patterns per type supported
         raw_patterns = {
             'schema_def': ['^\\s*schema\\s*\\{', '^\\s*schema\\s*@[^{]*\\{'],
@@ -721,11 +803,13 @@ class GraphQLModule:
             for p in pattern_list:
                 try:
                     compiled.append(re.compile(p, re.IGNORECASE))
-                except Exception as e:
+                except re.error as e:
                     log.warning('[GraphQL] Invalid pattern for ' + obj_type + ': ' + str(e))
             if compiled:
                 patterns[obj_type] = compiled
         
+        # Compile once, then share the patterns with all subsequent modules
+        GraphQLModule._compiled_structure_patterns = patterns
         return patterns
     
     def _get_container_types(self):
@@ -901,6 +985,14 @@ class GraphQLModule:
                 should_track = True
                 single_line_block = False
             
+            # Scan the first significant character: blank lines, comments
+            # and lines such as '}' cannot start any structure pattern
+            if not stripped:
+                continue
+            initial = stripped[0]
+            if not (initial.isalpha() or initial in _PATTERN_INITIALS):
+                continue
+            
             # Now check for pattern matches
             matched_on_line = False
             for pattern_key, pattern_list in patterns.items():
@@ -1099,6 +1191,8 @@ class GraphQLModule:
     
     def _register_object(self, fullname, obj, short_name=None, obj_type=None, start_line=0, end_line=0):
         """Register an object in the module's symbol table."""
+        # Interned: the same fullname keys several tables here and in the library
+        fullname = sys.intern(fullname)
         self.objects[fullname] = obj
         # Store line range for caller resolution
         if start_line > 0:
@@ -1106,6 +1200,7 @@ class GraphQLModule:
         # Store by type name (passed explicitly since get_type() may not work after save)
         type_name = obj_type if obj_type else 'unknown'
         self.objects_by_type[type_name].append(obj)
+        self.object_types[fullname] = type_name
         # Store short_name for later registration in library
         if short_name:
             if not hasattr(self, '_short_names'):
@@ -1234,10 +1329,20 @@ class GraphQLModule:
         # =====================================================================
         # GRAPHQL IMPLEMENTATION: Extract type references from fields
         # =====================================================================
-        # Parse the source to find type references in field arguments
-        # Example: createUser(input: CreateUserInput!): User!
-        # Creates link: createUser -> CreateUserInput (only input types, not return types)
+        # See _iter_type_references() for the detection logic
+        self.pending_links.extend(self._iter_type_references())
+    
+    def _iter_type_references(self):
+        """
+        Yield the type references found in field arguments.
         
+        Example: createUser(input: CreateUserInput!): User!
+        yields a link createUser -> CreateUserInput (only input types,
+        not return types).
+        
+        Yields:
+            dict: Pending link entry, in the format described in full_parse()
+        """
         if not self.source_content:
             return
         
@@ -1245,7 +1350,7 @@ class GraphQLModule:
         for line_num, line in enumerate(lines, 1):
             # Pattern for field with arguments
             # fieldName(arg: ArgType, ...): ReturnType
-            field_match = re.match(r'^\s*([a-z][A-Za-z0-9_]*)\s*\(([^)]+)\)\s*:', line)
+            field_match = _FIELD_WITH_ARGS_RE.match(line)
             if field_match:
                 field_name = field_match.group(1)
                 args_str = field_match.group(2)
@@ -1255,16 +1360,16 @@ class GraphQLModule:
                 
                 # Extract argument types (ignore primitives and return types)
                 # Pattern: argName: ArgType or argName: ArgType!
-                for arg_match in re.finditer(r'([a-z][A-Za-z0-9_]*)\s*:\s*\[?([A-Z][A-Za-z0-9_]+)', args_str):
+                for arg_match in _ARG_TYPE_RE.finditer(args_str):
                     arg_type = arg_match.group(2)
                     # Skip GraphQL built-in scalar types
-                    if arg_type not in ['String', 'Int', 'Float', 'Boolean', 'ID']:
-                        self.pending_links.append({
+                    if arg_type not in BUILTIN_SCALARS:
+                        yield {
                             'caller': caller,
                             'callee': arg_type,
                             'type': 'useLink',
                             'line': line_num
-                        })
+                        }
     
     def _extract_calls(self):
         """
@@ -1390,30 +1495,42 @@ class GraphQLModule:
         # Resolve type names to GraphQL type objects (Type, Input, Enum, etc.)
         
         for link_info in self.pending_links:
-            callee_name = link_info['callee']
-            
-            # Strategy 1: Try same-file resolution first
-            for fullname, obj in self.objects.items():
-                # Check if object name matches (type names like User, CreateUserInput, etc.)
-                if fullname.endswith('.' + callee_name):
-                    link_info['resolved_callee'] = obj
-                    link_info['resolved_callee_fullname'] = fullname
+            self._resolve_link(link_info, library)
+    
+    def _resolve_link(self, link_info, library):
+        """
+        Resolve the callee of a single pending link.
+        
+        Sets 'resolved_callee' and 'resolved_callee_fullname' on link_info
+        when a target is found; leaves it untouched otherwise.
+        
+        Args:
+            link_info (dict): Pending link entry
+            library: The global library containing all symbols across all files
+        """
+        callee_name = link_info['callee']
+        
+        # Strategy 1: Try same-file resolution first
+        for fullname, obj in self.objects.items():
+            # Check if object name matches (type names like User, CreateUserInput, etc.)
+            if fullname.endswith('.' + callee_name):
+                link_info['resolved_callee'] = obj
+                link_info['resolved_callee_fullname'] = fullname
+                return
+        
+        # Strategy 2: Try cross-file resolution if not found locally
+        candidates = library.symbols_by_name.get(callee_name, [])
+        if len(candidates) == 1:  # Only if unambiguous
+            fullname = candidates[0]
+            link_info['resolved_callee'] = library.symbols[fullname]
+            link_info['resolved_callee_fullname'] = fullname
+        elif len(candidates) > 1:
+            # Multiple candidates - try to find GraphQL types
+            for candidate_fn in candidates:
+                if any(x in candidate_fn for x in ['.graphql', '.gql', '.graphqls']):
+                    link_info['resolved_callee'] = library.symbols[candidate_fn]
+                    link_info['resolved_callee_fullname'] = candidate_fn
                     break
-            
-            # Strategy 2: Try cross-file resolution if not found locally
-            if 'resolved_callee' not in link_info:
-                candidates = library.symbols_by_name.get(callee_name, [])
-                if len(candidates) == 1:  # Only if unambiguous
-                    fullname = candidates[0]
-                    link_info['resolved_callee'] = library.symbols[fullname]
-                    link_info['resolved_callee_fullname'] = fullname
-                elif len(candidates) > 1:
-                    # Multiple candidates - try to find GraphQL types
-                    for candidate_fn in candidates:
-                        if any(x in candidate_fn for x in ['.graphql', '.gql', '.graphqls']):
-                            link_info['resolved_callee'] = library.symbols[candidate_fn]
-                            link_info['resolved_callee_fullname'] = candidate_fn
-                            break
     
     def save_links(self):
         """
@@ -1540,35 +1657,64 @@ class GraphQLModule:
         
         links_created = 0
         for link_info in self.pending_links:
-            if 'resolved_callee' not in link_info:
-                continue  # Skip unresolved links
-            
-            caller_fullname = link_info['caller']
-            callee_obj = link_info['resolved_callee']
-            link_type = link_info.get('type', 'useLink')
-            line = link_info.get('line', 0)
-            
-            caller_obj = self.objects.get(caller_fullname)
-            if not caller_obj:
-                continue
-            
-            # Create bookmark for navigation
-            bookmark = None
-            if line > 0 and self.file:
-                bookmark = Bookmark(self.file, line, 1, line, -1)
-            
-            # Create the link using CAST SDK
-            if bookmark:
-                create_link(link_type, caller_obj, callee_obj, bookmark)
-            else:
-                create_link(link_type, caller_obj, callee_obj)
-            
-            links_created += 1
-            log.debug('[GraphQL] Created ' + link_type + ' from ' + 
-                     caller_fullname + ' to ' + link_info.get('resolved_callee_fullname', 'unknown'))
+            links_created += self._save_link(link_info)
         
         return links_created
     
+    def _save_link(self, link_info):
+        """
+        Create the CAST link for a single resolved pending link.
+        
+        Args:
+            link_info (dict): Pending link entry, as updated by _resolve_link()
+            
+        Returns:
+            int: 1 if the link was created, 0 if it was skipped
+        """
+        if 'resolved_callee' not in link_info:
+            return 0  # Skip unresolved links
+        
+        caller_fullname = link_info['caller']
+        callee_obj = link_info['resolved_callee']
+        link_type = link_info.get('type', 'useLink')
+        line = link_info.get('line', 0)
+        
+        caller_obj = self.objects.get(caller_fullname)
+        if not caller_obj:
+            return 0
+        
+        # Create bookmark for navigation
+        bookmark = None
+        if line > 0 and self.file:
+            bookmark = Bookmark(self.file, line, 1, line, -1)
+        
+        # Create the link using CAST SDK
+        if bookmark:
+            create_link(link_type, caller_obj, callee_obj, bookmark)
+        else:
+            create_link(link_type, caller_obj, callee_obj)
+        
+        log.debug('[GraphQL] Created ' + link_type + ' from ' + 
+                 caller_fullname + ' to ' + link_info.get('resolved_callee_fullname', 'unknown'))
+        return 1
+    
+    def process(self, library):
+        """
+        PHASE 2: Detect, resolve and save the links of this module.
+        
+        Runs full_parse(), resolve() and save_links() in sequence; override
+        those methods to customize link detection.
+        
+        Args:
+            library: The global library containing all symbols across all files
+            
+        Returns:
+            int: Number of links created
+        """
+        self.full_parse()
+        self.resolve(library)
+        return self.save_links()
+    
     # =========================================================================
     # CLEANUP
     # =========================================================================
@@ -7,10 +7,61 @@ This module tests the analysis of GraphQL source files to verify that:
 - Object hierarchy is properly established
 """
 
+import glob
+import os
 import unittest
 import cast.analysers.test
 from cast.analysers.test import UATestAnalysis
 
+import graphql_module
+from graphql_module import GraphQLModule, GraphQLLibrary
+
+
+TEST_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_data')
+
+# One construct of each kind the structure patterns detect, including the
+# ones starting with a quote, a brace, a dot or a dollar sign
+ALL_CONSTRUCTS_SOURCE = '''schema { query: Query }
+"""A user"""
+type User {
+  id: ID!
+  "The name" name: String
+  posts(first: Int): [Post!]! @deprecated
+}
+extend type User @key {
+  email: String
+}
+interface Node { id: ID! }
+enum Role {
+  ADMIN
+  USER @deprecated
+}
+input UserFilter {
+  name: String
+}
+union Result = User | Post
+scalar Date
+directive @auth(requires: Role) on FIELD_DEFINITION
+query GetUser($id: ID!, $limit: Int = 10) {
+  user(id: $id) {
+    ... on User {
+      name
+    }
+  }
+}
+{ users { id } }
+mutation CreateUser {
+  createUser { id }
+}
+subscription OnUser {
+  userAdded { id }
+}
+fragment UserParts on User {
+  id
+}
+$orphan: String
+'''
+
 
 class TestGraphQLAnalyzerLevel(unittest.TestCase):
     """Test suite for GraphQL analyzer level processing."""
@@ -59,5 +110,83 @@ class TestGraphQLAnalyzerLevel(unittest.TestCase):
         # self.assertGreater(len(programs), 0, "No programs were created")
 
 
+
+class _AnyInitial:
+    """Accepts every first character: disables the Phase 1 line prefilter."""
+    
+    def __contains__(self, char):
+        return True
+
+
+class TestLightAstPrefilter(unittest.TestCase):
+    """The Phase 1 line prefilter must not drop any construct."""
+    
+    def _dump(self, node):
+        return (node.type, node.name, node.start_line, node.end_line,
+                [self._dump(child) for child in node.children])
+    
+    def _build(self, module, prefilter):
+        initials = graphql_module._PATTERN_INITIALS
+        if not prefilter:
+            graphql_module._PATTERN_INITIALS = _AnyInitial()
+        try:
+            return self._dump(module._build_light_ast())
+        finally:
+            graphql_module._PATTERN_INITIALS = initials
+    
+    def assertSameAst(self, module):
+        filtered = self._build(module, prefilter=True)
+        self.assertEqual(filtered, self._build(module, prefilter=False))
+        self.assertTrue(filtered[4], 'No construct found in ' + module.path)
+    
+    def test_test_data(self):
+        paths = glob.glob(os.path.join(TEST_DATA, '*.graphql*'))
+        self.assertTrue(paths)
+        for path in paths:
+            module = GraphQLModule(path)
+            module._read_source()
+            self.assertSameAst(module)
+    
+    def test_all_constructs(self):
+        module = GraphQLModule('all_constructs.graphql')
+        module.source_content = ALL_CONSTRUCTS_SOURCE
+        self.assertSameAst(module)
+
+
+
+class FakeModule:
+    """Minimal stand-in for a GraphQLModule in Phase 2, no CAST object needed."""
+    
+    def __init__(self, path, object_count, link_count=0, error=None):
+        self.path = path
+        self.objects = dict((path + '.obj' + str(i), object()) for i in range(object_count))
+        self.link_count = link_count
+        self.error = error
+        self.cleaned = False
+    
+    def process(self, library):
+        if self.error:
+            raise self.error
+        return self.link_count
+    
+    def clean_ast(self):
+        self.cleaned = True
+
+
+class TestProcessAll(unittest.TestCase):
+    """GraphQLLibrary.process_all() counts every module, a failing one included."""
+    
+    def test_failing_module_does_not_stop_the_others(self):
+        library = GraphQLLibrary()
+        modules = [FakeModule('a.graphql', 2, link_count=1),
+                   FakeModule('b.graphql', 3, error=ValueError('broken')),
+                   FakeModule('c.graphql', 1, link_count=4)]
+        for module in modules:
+            library.add_module(module)
+        
+        self.assertEqual(library.process_all(), (6, 5, 1))
+        self.assertEqual([module.cleaned for module in modules], [True, False, True])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import unittest
 import logging
+from unittest import mock
 
 import cast_upgrade_1_6_23  # @UnusedImport
 from cast.application import LinkType, Server
@@ -11,6 +12,67 @@ except:
     # this import does not work in eclipse, then
     pass
 
+import graphql_application_level
+from graphql_application_level import GraphQLApplicationLevel, FIELDS_SELECTED_PROPERTY, ANNOTATION_PROPERTY
+
+
+class FakeType:
+    """Metamodel type of a FakeObject."""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeObject:
+    """Minimal stand-in for a knowledge base object, no KB needed."""
+
+    def __init__(self, name, fullname, object_type, properties=None):
+        self.name = name
+        self.fullname = fullname
+        self.type = FakeType(object_type)
+        self.properties = properties or {}
+
+    def get_name(self):
+        return self.name
+
+    def get_fullname(self):
+        return self.fullname
+
+    def get_type(self):
+        return self.type.name
+
+    def get_property(self, prop):
+        return self.properties.get(prop)
+
+
+class FakeQuery:
+    """Stand-in for application.objects(): has_type() also yields the subtypes given."""
+
+    def __init__(self, objects_by_type):
+        self.objects_by_type = objects_by_type
+        self.objects = []
+
+    def has_type(self, object_type):
+        query = FakeQuery(self.objects_by_type)
+        query.objects = list(self.objects_by_type.get(object_type, []))
+        return query
+
+    def load_property(self, prop):
+        return self
+
+    def __iter__(self):
+        return iter(self.objects)
+
+
+class FakeApplication:
+    """Stand-in for a CAST Application, objects() listed by queried type."""
+
+    def __init__(self, objects_by_type):
+        self.objects_by_type = objects_by_type
+
+    def objects(self):
+        return FakeQuery(self.objects_by_type)
+
 
 class TestLocalKb(unittest.TestCase):
 
@@ -337,3 +399,86 @@ class TestLocalKb(unittest.TestCase):
         #     print("(all_links_cnt= {}) {}".format(cnt, l))
         #     pos = l.get_positions()
         #     print(pos)
+
+
+class TestMultiFieldLinks(unittest.TestCase):
+    """Fields sharing a name (e.g. declared again in a type extension) are all linked."""
+
+    def setUp(self):
+        self.extension = GraphQLApplicationLevel()
+        self.user_field = FakeObject('user', 'schema.graphqls.Query.user', 'GraphQLField')
+        self.user_field_ext = FakeObject('user', 'extension.graphqls.Query.user', 'GraphQLField')
+        self.posts_field = FakeObject('posts', 'schema.graphqls.Query.posts', 'GraphQLField')
+        self.schema_index = {
+            'Query': {'user': [self.user_field, self.user_field_ext], 'posts': [self.posts_field]},
+            'Mutation': {},
+            'Subscription': {},
+        }
+
+    def test_client_links_every_field_of_a_name_once(self):
+        client = FakeObject('GetUser', 'client.GetUser', 'GraphQLClientQuery',
+                            {FIELDS_SELECTED_PROPERTY: 'user, posts, user'})
+        pending_links = []
+        count = self.extension._link_client_to_fields(client, self.schema_index['Query'], 'Query', pending_links)
+        self.assertEqual(count, 3)
+        self.assertEqual(pending_links, [('useLink', client, self.user_field),
+                                         ('useLink', client, self.user_field_ext),
+                                         ('useLink', client, self.posts_field)])
+
+    def test_resolver_matches_every_field_of_a_name(self):
+        method = FakeObject('user', 'com.example.UserController.user', 'JV_METHOD',
+                            {ANNOTATION_PROPERTY: ['@QueryMapping']})
+        match = self.extension._match_resolver('user', method, self.schema_index)
+        self.assertIsNotNone(match)
+        operation_type, mapping, schema_objs, _ = match
+        self.assertEqual((operation_type, mapping), ('Query', '@QueryMapping'))
+        self.assertEqual(schema_objs, [self.user_field, self.user_field_ext])
+
+
+class UnreadableMethod(FakeObject):
+    """A JV_METHOD whose fullname cannot be read."""
+
+    def get_fullname(self):
+        raise RuntimeError('unreadable')
+
+
+class TestSchemaToBackendPrefilter(unittest.TestCase):
+    """Only readable, exact JV_METHOD objects of @Controller classes are linked."""
+
+    def test_unreadable_and_subtype_methods_are_skipped(self):
+        extension = GraphQLApplicationLevel()
+        user_field = FakeObject('user', 'schema.graphqls.Query.user', 'GraphQLField')
+        schema_index = {'Query': {'user': [user_field]}, 'Mutation': {}, 'Subscription': {}}
+        controller = FakeObject('UserController', 'com.example.UserController', 'JV_CLASS',
+                                {ANNOTATION_PROPERTY: ['@Controller']})
+        resolver_annotations = {ANNOTATION_PROPERTY: ['@QueryMapping']}
+        unreadable = UnreadableMethod('user', None, 'JV_METHOD', resolver_annotations)
+        subtype = FakeObject('user', 'com.example.UserController.user', 'JV_METHOD_SUBTYPE',
+                             resolver_annotations)
+        resolver = FakeObject('user', 'com.example.UserController.user', 'JV_METHOD',
+                              resolver_annotations)
+        application = FakeApplication({'JV_CLASS': [controller],
+                                       'JV_METHOD': [unreadable, subtype, resolver]})
+        pending_links = []
+        extension._link_schema_to_backend(application, schema_index, pending_links)
+        self.assertEqual(pending_links, [('callLink', user_field, resolver)])
+
+
+class TestCreateLinks(unittest.TestCase):
+    """A failing link does not prevent the creation of the others."""
+
+    def test_failing_link_does_not_stop_the_others(self):
+        client = FakeObject('GetUser', 'client.GetUser', 'GraphQLClientQuery')
+        fields = [FakeObject(name, 'schema.graphqls.Query.' + name, 'GraphQLField')
+                  for name in ('user', 'broken', 'posts')]
+        created = []
+
+        def create_link(link_type, caller, callee):
+            if callee is fields[1]:
+                raise RuntimeError('link refused')
+            created.append((link_type, caller, callee))
+
+        pending_links = [('useLink', client, field) for field in fields]
+        with mock.patch.object(graphql_application_level, 'create_link', create_link):
+            GraphQLApplicationLevel()._create_links(pending_links)
+        self.assertEqual(created, [pending_links[0], pending_links[2]])